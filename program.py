@@ -1,228 +1,284 @@
 import os
+import sys
+from functools import lru_cache
+from typing import NamedTuple
+
+from trend_core import (FALLING, HPA_TO_INHG, INHG_TO_MB, KPA_TO_INHG, RISING, STEADY,
+                        TREND_THRESHOLD, trend_core, trend_from_diff)
+
+# ANSI escape sequence: clear the whole screen, then move the cursor home
+CLEAR_SEQUENCE = "\x1b[2J\x1b[H"
+
+def _enable_vt_mode():
+    """
+    Make sure the console understands ANSI escape sequences.
+    On Windows this turns on virtual terminal processing for stdout once;
+    other platforms support the sequences out of the box.
+    Returns True if the escape sequences can be used.
+    """
+    if os.name != "nt":
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # 0x0004 = ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+VT_ENABLED = _enable_vt_mode()
 
 def clear_console():
-    """Clear the console screen (uses 'cls' for Windows)."""
-    os.system('cls')
+    """
+    Clear the console screen.
+    Writes the ANSI clear sequence directly instead of spawning a shell;
+    falls back to 'cls' if the Windows console can't handle escape sequences.
+    """
+    if VT_ENABLED:
+        sys.stdout.write(CLEAR_SEQUENCE)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+# Display names for the trend ids
+TREND_NAMES = ("Rising", "Falling", "Steady")
+
+# Station model tendency symbol, indexed by [first period trend][second period trend]
+TENDENCY_SYMBOLS = (
+    ("+", "+/", "+="),   # Rising then Rising / Falling / Steady
+    ("-+", "-", "-="),   # Falling then Rising / Falling / Steady
+    ("=+", "=-", "="),   # Steady then Rising / Falling / Steady
+)
+
+# Per-unit parameters:
+# (current to inHg, past to inHg, mb to display, current shown in inHg,
+#  unit label, short unit label)
+UNIT_TABLE = {
+    "inHg": (1.0, 1.0, 1.0 / INHG_TO_MB, True, "inHg", "inHg"),
+    "hPa": (HPA_TO_INHG, HPA_TO_INHG, 1.0, False, "hPa", "hPa"),
+    "kPa": (KPA_TO_INHG, KPA_TO_INHG, 0.1, False, "kPa", "kPa"),
+    "custom": (1.0, HPA_TO_INHG, 1.0, True, "hPa (change), inHg (current)", "hPa"),
+}
+
+class TrendResult(NamedTuple):
+    """Result of calculate_pressure_trend."""
+    current_pressure_display: float  # Current pressure in the chosen unit
+    current_pressure_mb: float       # Current pressure in mb, rounded to 0.1
+    station_model_pressure: int      # Last 3 digits of the current pressure in tenths of mb
+    pressure_change_display: float   # 3-hour change in the chosen unit
+    pressure_change_mb: float        # 3-hour change in mb, rounded to 0.1
+    trend_value: int                 # Absolute 3-hour change in tenths of mb
+    overall_trend: str               # 'Rising', 'Falling', or 'Steady'
+    tendency_description: str        # e.g. 'Rising then Steady'
+    tendency_symbol: str             # Station model tendency symbol, e.g. '+='
+    unit: str
+    unit_label: str
+    unit_label_short: str
+
+def determine_trend_id(pressure1, pressure2, threshold=TREND_THRESHOLD):
+    """
+    Determine the trend between two pressure readings (in inHg).
+    Returns RISING, FALLING, or STEADY based on the difference.
+    Threshold avoids minor fluctuations being counted as a change.
+    """
+    return trend_from_diff(pressure2 - pressure1, threshold)
 
-def determine_trend(pressure1, pressure2, threshold=0.01):
+def determine_trend(pressure1, pressure2, threshold=TREND_THRESHOLD):
     """
     Determine the trend between two pressure readings (in inHg).
     Returns 'Rising', 'Falling', or 'Steady' based on the difference.
     Threshold avoids minor fluctuations being counted as a change.
     """
-    diff = pressure2 - pressure1
-    if diff > threshold:
-        return "Rising"
-    elif diff < -threshold:
-        return "Falling"
-    else:
-        return "Steady"
+    return TREND_NAMES[determine_trend_id(pressure1, pressure2, threshold)]
 
+@lru_cache(maxsize=128)
 def calculate_pressure_trend(current_pressure, past_pressures, unit="inHg"):
     """
     Calculate the pressure trend for a station model, including intermediate trends.
+    Results are cached, so repeated readings are returned without recalculating.
     
     Parameters:
     current_pressure (float): Current pressure in chosen unit (inHg, hPa, kPa, or custom)
-    past_pressures (list): List of pressures [1 hour ago, 2 hours ago, 3 hours ago] in chosen unit
+    past_pressures (tuple): Pressures (1 hour ago, 2 hours ago, 3 hours ago) in chosen unit
     unit (str): Unit of input pressure ('inHg', 'hPa', 'kPa', or 'custom')
     
     Returns:
-    dict: Dictionary containing current pressure (mb and station model format),
-          pressure change (mb), trend value (tenths of mb), overall trend direction,
-          and detailed tendency description.
-    """
-    # Conversion factors
-    INHG_TO_MB = 33.8639   # 1 inHg = 33.8639 mb
-    HPA_TO_INHG = 0.02953   # 1 hPa = 0.02953 inHg
-    KPA_TO_INHG = 0.2953    # 1 kPa = 10 hPa = 0.2953 inHg
-    
-    # Convert input pressures to inHg for internal consistency
-    if unit == "hPa":
-        current_pressure_inhg = current_pressure * HPA_TO_INHG
-        past_pressures_inhg = [p * HPA_TO_INHG for p in past_pressures]
-    elif unit == "kPa":
-        current_pressure_inhg = current_pressure * KPA_TO_INHG
-        past_pressures_inhg = [p * KPA_TO_INHG for p in past_pressures]
-    elif unit == "custom":
-        current_pressure_inhg = current_pressure  # Current pressure in inHg
-        past_pressures_inhg = [p * HPA_TO_INHG for p in past_pressures]  # Past pressures in hPa to inHg
-    else:  # inHg
-        current_pressure_inhg = current_pressure
-        past_pressures_inhg = past_pressures
-    
-    # Convert pressures to millibars for station model
-    current_pressure_mb = current_pressure_inhg * INHG_TO_MB
-    pressure_1h_ago_mb = past_pressures_inhg[0] * INHG_TO_MB
-    pressure_2h_ago_mb = past_pressures_inhg[1] * INHG_TO_MB
-    pressure_3h_ago_mb = past_pressures_inhg[2] * INHG_TO_MB
-    
-    # Calculate pressure change over 3 hours (current - 3h ago)
-    pressure_change_mb = current_pressure_mb - pressure_3h_ago_mb
-    
-    # Round pressure change to nearest 0.1 mb for station model
-    pressure_change_mb = round(pressure_change_mb, 1)
-    
-    # Determine overall trend direction
-    if pressure_change_mb > 0:
-        overall_trend = "Rising"
-    elif pressure_change_mb < 0:
-        overall_trend = "Falling"
-    else:
-        overall_trend = "Steady"
-    
-    # Calculate trend value in tenths of millibars (absolute value)
-    trend_value = int(abs(pressure_change_mb) * 10)
-    
-    # Format current pressure for station model (last 3 digits of mb, e.g., 1013.2 -> 132)
-    current_pressure_mb_rounded = round(current_pressure_mb, 1)
-    station_model_pressure = int(current_pressure_mb_rounded * 10) % 1000
-    
-    # Convert current pressure and change back to chosen unit for display
-    if unit == "hPa":
-        display_current_pressure = current_pressure_mb_rounded  # Already in mb (hPa)
-        display_pressure_change = pressure_change_mb  # Already in mb (hPa)
-        unit_label = "hPa"
-    elif unit == "kPa":
-        display_current_pressure = current_pressure_mb_rounded / 10  # Convert mb to kPa
-        display_pressure_change = pressure_change_mb / 10  # Convert mb to kPa
-        unit_label = "kPa"
-    elif unit == "custom":
-        display_current_pressure = current_pressure_inhg  # Current in inHg
-        display_pressure_change = pressure_change_mb  # Change in hPa (mb)
-        unit_label = "hPa (change), inHg (current)"
-    else:  # inHg
-        display_current_pressure = current_pressure_inhg
-        display_pressure_change = pressure_change_mb / INHG_TO_MB  # Convert mb to inHg
-        unit_label = "inHg"
-    
-    # Calculate intermediate trends (using inHg values)
-    trend_3h_to_2h = determine_trend(past_pressures_inhg[2], past_pressures_inhg[1])
-    trend_2h_to_1h = determine_trend(past_pressures_inhg[1], past_pressures_inhg[0])
-    trend_1h_to_now = determine_trend(past_pressures_inhg[0], current_pressure_inhg)
-    
-    # Simplify to two periods: first two hours (3h to 1h), last hour (1h to now)
-    if trend_3h_to_2h == trend_2h_to_1h:
-        first_period_trend = trend_3h_to_2h
-    elif trend_3h_to_2h == "Steady" and trend_2h_to_1h != "Steady":
-        first_period_trend = trend_2h_to_1h
-    elif trend_2h_to_1h == "Steady" and trend_3h_to_2h != "Steady":
-        first_period_trend = trend_3h_to_2h
-    else:
-        pressure_change_first_period = past_pressures_inhg[0] - past_pressures_inhg[2]
-        first_period_trend = determine_trend(past_pressures_inhg[2], past_pressures_inhg[0])
+    TrendResult: Current pressure (mb and station model format), pressure change (mb),
+                 trend value (tenths of mb), overall trend direction,
+                 and detailed tendency description.
+    """
+    # Unknown units are treated as inHg
+    (current_to_inhg, past_to_inhg, mb_to_display,
+     current_display_in_inhg, unit_label, unit_label_short) = UNIT_TABLE.get(unit, UNIT_TABLE["inHg"])
+    (current_pressure_mb_rounded, station_model_pressure, pressure_change_mb,
+     display_pressure_change, display_current_pressure, trend_value,
+     overall_id, first_id, second_id) = trend_core(current_pressure, *past_pressures,
+                                                    current_to_inhg, past_to_inhg,
+                                                    mb_to_display, current_display_in_inhg)
     
-    second_period_trend = trend_1h_to_now
+    # Turn the trend ids back into names
+    overall_trend = TREND_NAMES[overall_id]
+    first_period_trend = TREND_NAMES[first_id]
+    second_period_trend = TREND_NAMES[second_id]
     
     # Determine the tendency description
     tendency_description = f"{first_period_trend} then {second_period_trend}"
     
     # Station model tendency symbol
-    tendency_symbol = ""
-    if first_period_trend == "Rising" and second_period_trend == "Falling":
-        tendency_symbol = "+/"
-    elif first_period_trend == "Falling" and second_period_trend == "Rising":
-        tendency_symbol = "-+"
-    elif first_period_trend == "Rising" and second_period_trend == "Steady":
-        tendency_symbol = "+="
-    elif first_period_trend == "Falling" and second_period_trend == "Steady":
-        tendency_symbol = "-="
-    elif first_period_trend == "Rising" and second_period_trend == "Rising":
-        tendency_symbol = "+"
-    elif first_period_trend == "Falling" and second_period_trend == "Falling":
-        tendency_symbol = "-"
-    elif first_period_trend == "Steady" and second_period_trend == "Rising":
-        tendency_symbol = "=+"
-    elif first_period_trend == "Steady" and second_period_trend == "Falling":
-        tendency_symbol = "=-"
-    elif first_period_trend == "Steady" and second_period_trend == "Steady":
-        tendency_symbol = "="
-    
-    return {
-        "current_pressure_display": display_current_pressure,
-        "current_pressure_mb": current_pressure_mb_rounded,
-        "station_model_pressure": station_model_pressure,
-        "pressure_change_display": display_pressure_change,
-        "pressure_change_mb": pressure_change_mb,
-        "trend_value": trend_value,
-        "overall_trend": overall_trend,
-        "tendency_description": tendency_description,
-        "tendency_symbol": tendency_symbol,
-        "unit": unit,
-        "unit_label": unit_label
-    }
+    tendency_symbol = TENDENCY_SYMBOLS[first_id][second_id]
+    
+    return TrendResult(
+        current_pressure_display=display_current_pressure,
+        current_pressure_mb=current_pressure_mb_rounded,
+        station_model_pressure=station_model_pressure,
+        pressure_change_display=display_pressure_change,
+        pressure_change_mb=pressure_change_mb,
+        trend_value=trend_value,
+        overall_trend=overall_trend,
+        tendency_description=tendency_description,
+        tendency_symbol=tendency_symbol,
+        unit=unit,
+        unit_label=unit_label,
+        unit_label_short=unit_label_short
+    )
+
+def calculate_pressure_trend_batch(current_pressures, past_pressures, unit="inHg"):
+    """
+    Calculate the numeric pressure trend values for many readings at once.
+    The unit is looked up once and each row goes straight to the numeric core,
+    skipping the cache and the TrendResult, so large data sets stay fast.
+    
+    Parameters:
+    current_pressures (iterable): Current pressures in chosen unit
+    past_pressures (iterable): Matching (1 hour ago, 2 hours ago, 3 hours ago) pressures
+    unit (str): Unit of all the readings ('inHg', 'hPa', 'kPa', or 'custom')
+    
+    Returns:
+    list: One tuple per row, laid out as returned by trend_core (trends as ids;
+          use TREND_NAMES and TENDENCY_SYMBOLS to turn them into text)
+    """
+    current_to_inhg, past_to_inhg, mb_to_display, current_display_in_inhg = \
+        UNIT_TABLE.get(unit, UNIT_TABLE["inHg"])[:4]
+    return [trend_core(current_pressure, pressure_1h, pressure_2h, pressure_3h,
+                        current_to_inhg, past_to_inhg, mb_to_display, current_display_in_inhg)
+            for current_pressure, (pressure_1h, pressure_2h, pressure_3h)
+            in zip(current_pressures, past_pressures)]
+
+def prompt(message):
+    """
+    Show a prompt and read one line from stdin.
+    A lighter alternative to input() for plain numeric entries (no readline
+    history or line editing). Returns the line without its trailing newline.
+    """
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    return sys.stdin.readline().rstrip("\n")
+
+# Menu choices for the unit prompt
+UNIT_CHOICES = {"1": "inHg", "2": "hPa", "3": "kPa", "4": "custom"}
+
+def read_inputs():
+    """
+    Show the unit menu and read the pressure readings from the user.
+    
+    Returns:
+    tuple: (unit, current pressure, (1 hour ago, 2 hours ago, 3 hours ago))
+    
+    Raises ValueError if the readings aren't valid numbers.
+    """
+    # Title and unit menu, written in one go
+    sys.stdout.write(
+        "Pressure Trend Calculator\n"
+        "------------------------\n"
+        "Select pressure unit:\n"
+        "1. inHg (inches of mercury)\n"
+        "2. hPa (hectopascals)\n"
+        "3. kPa (kilopascals)\n"
+        "4. Custom (current in inHg, past in hPa)\n"
+    )
+    unit_choice = input("Enter 1, 2, 3, or 4: ").strip()
+    
+    unit = UNIT_CHOICES.get(unit_choice)
+    if unit is None:
+        print("\nInvalid choice. Defaulting to inHg.")
+        unit = "inHg"
+    unit_label = UNIT_TABLE[unit][4]
+    
+    # Input pressures
+    if unit == "custom":
+        print("\nEnter current pressure in inHg and past pressures in hPa:")
+        current_unit, past_unit = "inHg", "hPa"
+    else:
+        print(f"\nEnter pressures in {unit_label}:")
+        current_unit = past_unit = unit_label
+    
+    # Fast path: all four readings on one line, e.g. "29.92 29.90 29.85 29.80"
+    readings = prompt("Enter current, 1h, 2h and 3h ago separated by spaces "
+                      "(or press Enter to type them one at a time): ")
+    try:
+        current_pressure, pressure_1h, pressure_2h, pressure_3h = map(float, readings.split())
+    except ValueError:
+        # Not four numbers, ask for each reading separately
+        current_pressure = float(prompt(f"Enter current pressure ({current_unit}): "))
+        pressure_1h = float(prompt(f"Enter pressure 1 hour ago ({past_unit}): "))
+        pressure_2h = float(prompt(f"Enter pressure 2 hours ago ({past_unit}): "))
+        pressure_3h = float(prompt(f"Enter pressure 3 hours ago ({past_unit}): "))
+    
+    return unit, current_pressure, (pressure_1h, pressure_2h, pressure_3h)
+
+def format_result(result):
+    """Format a calculate_pressure_trend result as the multi-line results block."""
+    return "\n".join([
+        "Pressure Trend Results:",
+        f"Current Pressure: {result.current_pressure_display:.2f} {result.unit_label_short} "
+        f"({result.current_pressure_mb:.1f} mb)",
+        f"Station Model Pressure: {result.station_model_pressure:03d}",
+        f"Pressure Change (3 hours): {result.pressure_change_display:+.1f} {result.unit_label_short} "
+        f"({result.pressure_change_mb:+.1f} mb)",
+        f"Pressure Trend: {result.trend_value} tenths of mb "
+        f"({result.overall_trend})",
+        f"Pressure Tendency: {result.tendency_description} "
+        f"(Symbol: {result.tendency_symbol})",
+    ])
+
+def run_once(current_pressure, past_pressures, unit="inHg"):
+    """Calculate the pressure trend for one set of readings and return the formatted results."""
+    return format_result(calculate_pressure_trend(current_pressure, tuple(past_pressures), unit))
+
+def run_batch(rows, unit="inHg"):
+    """
+    Calculate the pressure trend for many sets of readings without any prompts.
+    
+    Parameters:
+    rows (iterable): Rows of (current, 1 hour ago, 2 hours ago, 3 hours ago) pressures
+    unit (str): Unit of all the readings ('inHg', 'hPa', 'kPa', or 'custom')
+    
+    Returns:
+    list: One calculate_pressure_trend result per row
+    """
+    return [calculate_pressure_trend(current_pressure, (pressure_1h, pressure_2h, pressure_3h), unit)
+            for current_pressure, pressure_1h, pressure_2h, pressure_3h in rows]
 
 def main():
     while True:
         # Clear console at the start of each calculation
         clear_console()
         
-        print("Pressure Trend Calculator")
-        print("------------------------")
-        
-        # Ask for unit preference
-        print("Select pressure unit:")
-        print("1. inHg (inches of mercury)")
-        print("2. hPa (hectopascals)")
-        print("3. kPa (kilopascals)")
-        print("4. Custom (current in inHg, past in hPa)")
-        unit_choice = input("Enter 1, 2, 3, or 4: ").strip()
-        
-        if unit_choice == "1":
-            unit = "inHg"
-            unit_label = "inHg"
-        elif unit_choice == "2":
-            unit = "hPa"
-            unit_label = "hPa"
-        elif unit_choice == "3":
-            unit = "kPa"
-            unit_label = "kPa"
-        elif unit_choice == "4":
-            unit = "custom"
-            unit_label = "hPa (change), inHg (current)"
-        else:
-            print("\nInvalid choice. Defaulting to inHg.")
-            unit = "inHg"
-            unit_label = "inHg"
-        
-        # Input pressures
         try:
-            if unit == "custom":
-                print("\nEnter current pressure in inHg and past pressures in hPa:")
-                current_pressure = float(input("Enter current pressure (inHg): "))
-                pressure_1h = float(input("Enter pressure 1 hour ago (hPa): "))
-                pressure_2h = float(input("Enter pressure 2 hours ago (hPa): "))
-                pressure_3h = float(input("Enter pressure 3 hours ago (hPa): "))
-            else:
-                print(f"\nEnter pressures in {unit_label}:")
-                current_pressure = float(input(f"Enter current pressure ({unit_label}): "))
-                pressure_1h = float(input(f"Enter pressure 1 hour ago ({unit_label}): "))
-                pressure_2h = float(input(f"Enter pressure 2 hours ago ({unit_label}): "))
-                pressure_3h = float(input(f"Enter pressure 3 hours ago ({unit_label}): "))
-            
-            past_pressures = [pressure_1h, pressure_2h, pressure_3h]
-            
-            # Calculate pressure trend
-            result = calculate_pressure_trend(current_pressure, past_pressures, unit)
+            unit, current_pressure, past_pressures = read_inputs()
             
-            # Display results
-            print("\nPressure Trend Results:")
-            print(f"Current Pressure: {result['current_pressure_display']:.2f} {result['unit_label'].split(' ')[0]} "
-                  f"({result['current_pressure_mb']:.1f} mb)")
-            print(f"Station Model Pressure: {result['station_model_pressure']:03d}")
-            print(f"Pressure Change (3 hours): {result['pressure_change_display']:+.1f} {result['unit_label'].split(' ')[0]} "
-                  f"({result['pressure_change_mb']:+.1f} mb)")
-            print(f"Pressure Trend: {result['trend_value']} tenths of mb "
-                  f"({result['overall_trend']})")
-            print(f"Pressure Tendency: {result['tendency_description']} "
-                  f"(Symbol: {result['tendency_symbol']})")
+            # Calculate and display results with a single write
+            sys.stdout.write("\n" + run_once(current_pressure, past_pressures, unit) + "\n")
         
         except ValueError:
             print("\nError: Please enter valid numeric values for pressures.")
         
         # Ask if user wants to continue
-        print("\nWould you like to calculate another trend? (y/n)")
-        choice = input().strip().lower()
+        choice = input("\nWould you like to calculate another trend? (y/n)\n").strip().lower()
         if choice != 'y':
             clear_console()
             print("Thank you for using the Pressure Trend Calculator!")
@@ -0,0 +1,96 @@
+# Numeric core of the Pressure Trend Calculator.
+# Kept in its own module so Python caches its compiled bytecode in __pycache__;
+# program.py is run as a script and would otherwise be recompiled on every launch.
+
+# Trend ids returned by the numeric core
+RISING, FALLING, STEADY = 0, 1, 2
+
+# Minimum change (in inHg) between two readings to count as rising or falling
+TREND_THRESHOLD = 0.01
+
+# Conversion factors
+INHG_TO_MB = 33.8639   # 1 inHg = 33.8639 mb
+HPA_TO_INHG = 0.02953   # 1 hPa = 0.02953 inHg
+KPA_TO_INHG = 0.2953    # 1 kPa = 10 hPa = 0.2953 inHg
+
+def trend_from_diff(diff, threshold=TREND_THRESHOLD):
+    """
+    Return RISING, FALLING, or STEADY for a precomputed pressure difference (in inHg).
+    Uses the comparison results as integers instead of branching:
+    STEADY (2) minus 2 if rising gives RISING (0), minus 1 if falling gives FALLING (1).
+    """
+    return STEADY - 2 * (diff > threshold) - (diff < -threshold)
+
+def to_tenths(value):
+    """Round a value to the nearest tenth (halves away from zero), returned as an integer count of tenths."""
+    return int(value * 10.0 + (0.5 if value >= 0 else -0.5))
+
+def trend_core(current_pressure, pressure_1h, pressure_2h, pressure_3h,
+               current_to_inhg, past_to_inhg, mb_to_display, current_display_in_inhg):
+    """
+    Numeric part of the pressure trend calculation.
+    Works only with floats and ints (unit parameters are passed in as factors,
+    trends are returned as ids) so it stays free of string handling.
+    
+    Returns:
+    tuple: (current pressure in mb, station model pressure, pressure change in mb,
+            pressure change for display, current pressure for display, trend value,
+            overall trend id, first period trend id, second period trend id)
+    """
+    # Convert all four readings (now, 1h, 2h, 3h ago) to inHg
+    current_pressure_inhg = current_pressure * current_to_inhg
+    past_pressures_inhg = (pressure_1h * past_to_inhg, pressure_2h * past_to_inhg,
+                           pressure_3h * past_to_inhg)
+    
+    # Convert pressures to millibars for station model (only now and 3h ago are needed)
+    current_pressure_mb = current_pressure_inhg * INHG_TO_MB
+    pressure_3h_ago_mb = past_pressures_inhg[2] * INHG_TO_MB
+    
+    # Calculate pressure change over 3 hours (current - 3h ago),
+    # rounded to nearest 0.1 mb for station model
+    pressure_change_tenths = to_tenths(current_pressure_mb - pressure_3h_ago_mb)
+    pressure_change_mb = pressure_change_tenths / 10
+    
+    # Determine overall trend direction
+    overall_trend = STEADY - 2 * (pressure_change_tenths > 0) - (pressure_change_tenths < 0)
+    
+    # Calculate trend value in tenths of millibars (absolute value)
+    trend_value = abs(pressure_change_tenths)
+    
+    # Format current pressure for station model (last 3 digits of mb, e.g., 1013.2 -> 132)
+    current_pressure_tenths = to_tenths(current_pressure_mb)
+    current_pressure_mb_rounded = current_pressure_tenths / 10
+    station_model_pressure = current_pressure_tenths % 1000
+    
+    # Convert current pressure and change back to chosen unit for display
+    if current_display_in_inhg:
+        display_current_pressure = current_pressure_inhg
+    else:
+        display_current_pressure = current_pressure_mb_rounded * mb_to_display
+    display_pressure_change = pressure_change_mb * mb_to_display
+    
+    # Calculate intermediate trends (using inHg values): take the hourly
+    # differences (3h to 2h, 2h to 1h, 1h to now) and classify them in one pass
+    hourly_changes = (past_pressures_inhg[1] - past_pressures_inhg[2],
+                      past_pressures_inhg[0] - past_pressures_inhg[1],
+                      current_pressure_inhg - past_pressures_inhg[0])
+    trend_3h_to_2h, trend_2h_to_1h, trend_1h_to_now = [
+        STEADY - 2 * (diff > TREND_THRESHOLD) - (diff < -TREND_THRESHOLD)
+        for diff in hourly_changes
+    ]
+    
+    # Simplify to two periods: first two hours (3h to 1h), last hour (1h to now)
+    if trend_3h_to_2h == trend_2h_to_1h:
+        first_period_trend = trend_3h_to_2h
+    elif trend_3h_to_2h == STEADY and trend_2h_to_1h != STEADY:
+        first_period_trend = trend_2h_to_1h
+    elif trend_2h_to_1h == STEADY and trend_3h_to_2h != STEADY:
+        first_period_trend = trend_3h_to_2h
+    else:
+        first_period_trend = trend_from_diff(past_pressures_inhg[0] - past_pressures_inhg[2])
+    
+    second_period_trend = trend_1h_to_now
+    
+    return (current_pressure_mb_rounded, station_model_pressure, pressure_change_mb,
+            display_pressure_change, display_current_pressure, trend_value,
+            overall_trend, first_period_trend, second_period_trend)